@@ -36,6 +36,8 @@ from typing_extensions import Literal
 
 from .list import Owners, OwnersEvent
 
+_FEATURES = frozenset({'check', 'assign', 'vote', 'value', 'time', 'location', 'play'})
+
 _USE_CASES = {
     'simple': {'title': 'New list', 'features': []},
     'todo': {'title': 'New to-do list', 'features': ['check', 'assign']},
@@ -158,9 +160,11 @@ class Listling(Application):
                 value_summary_ids=[('total', 0)] if 'value' in data['features'] else [],
                 activity=Activity(id=f'{id}.activity', subscriber_ids=[], app=self.app))
             self.app.r.oset(lst.id, lst)
-            self.app.r.zadd(f'{lst.id}.owners', {user.id.encode(): -now})
-            self.app.r.zadd(f'{lst.id}.users', {user.id.encode(): -now})
-            self.app.r.rpush(self.ids.key, lst.id)
+            pipe = self.app.r.r.pipeline()
+            pipe.zadd(f'{lst.id}.owners', {user.id.encode(): -now})
+            pipe.zadd(f'{lst.id}.users', {user.id.encode(): -now})
+            pipe.rpush(self.ids.key, lst.id)
+            pipe.execute()
             user.lists.add(lst)
             self.app.activity.publish(
                 Event.create('create-list', None, {'lst': lst}, app=self.app))
@@ -175,6 +179,7 @@ class Listling(Application):
                 '{}\n\n*This example was created just for you, so please feel free to play around.*'
                 .format(data[1]))
 
+            user = context.user.get()
             lst = self.create(use_case)
             await lst.edit(title=data[0], description=description)
             for item in data[2]:
@@ -186,7 +191,7 @@ class Listling(Application):
                 if checked:
                     item.check()
                 if user_assigned:
-                    item.assignees.assign(context.user.get())
+                    item.assignees.assign(user)
                 if user_voted:
                     item.votes.vote()
             return lst
@@ -392,28 +397,33 @@ class List(Object, Editable):
                 location=location.json() if location else None, checked=False)
 
             f = script(self.app.r.r, """
+                local id, list_id = unpack(KEYS)
                 local item_data, id_by_title, user_id, now = unpack(ARGV)
-                local item = cjson.decode(item_data)
-                local list = cjson.decode(redis.call("GET", item.list_id))
+                local list = cjson.decode(redis.call("GET", list_id))
                 local features = {}
                 for _, feature in pairs(list.features) do
                     features[feature] = true
                 end
 
-                redis.call("SET", item.id, item_data)
-                redis.call("SADD", "items", item.id)
-                redis.call("RPUSH", list.id .. ".items", item.id)
-                redis.call("ZADD", list.id .. ".items.by_title", 0, id_by_title)
-                redis.call("HSET", list.id .. ".items.by_title.lexical", item.id, id_by_title)
+                redis.call("SET", id, item_data)
+                redis.call("SADD", "items", id)
+                redis.call("RPUSH", list_id .. ".items", id)
+                redis.call("ZADD", list_id .. ".items.by_title", 0, id_by_title)
+                redis.call("HSET", list_id .. ".items.by_title.lexical", id, id_by_title)
                 if features.assign and list.assign_by_default then
-                    redis.call("ZADD", item.id .. ".assignees", -now, user_id)
+                    redis.call("ZADD", id .. ".assignees", -now, user_id)
+                    return 1
                 end
+                return 0
             """)
-            f(
-                [],
+            assigned = f(
+                [item.id, self.lst.id],
                 [json.dumps(item.json()), lexical_value(item.id, item.title), user.id,
                  self.app.now().timestamp()])
-            self.lst.update_value_summary()
+            # An item without a value and without assignees does not change the value summary, so
+            # skip the update
+            if item.value is not None or assigned:
+                self.lst.update_value_summary()
             self.lst.activity.publish(
                 Event.create('list-create-item', self.lst, {'item': item}, self.app))
             return item
@@ -528,19 +538,21 @@ class List(Object, Editable):
 
         self.value_summary_ids = []
         if items_data is not None:
-            items = [Item(app=self.app, **json.loads(item)) for item in items_data]
+            # Read the attributes directly instead of constructing full items, which would parse
+            # time, location and resource of each item
+            items: list[dict[str, Any]] = [json.loads(item) for item in items_data]
             self.value_summary_ids.append(
-                ('total', sum(item.value or 0 for item in items if not item.trashed)))
+                ('total', sum(item['value'] or 0 for item in items if not item['trashed'])))
 
             if assignee_ids_data:
                 assignee_ids = ([id.decode() for id in ids] for ids in assignee_ids_data)
                 shares: defaultdict[str, float] = defaultdict(float)
                 for item, ids in zip(items, assignee_ids):
-                    if not item.trashed:
+                    if not item['trashed']:
                         for id in ids:
-                            shares[id] += (item.value or 0) / len(ids)
-                self.value_summary_ids += list(
-                    sorted(shares.items(), key=lambda share: share[1], reverse=True))
+                            shares[id] += (item['value'] or 0) / len(ids)
+                self.value_summary_ids += sorted(shares.items(), key=lambda share: share[1],
+                                                 reverse=True)
 
         f = script(self.app.r.r, """
             local id, value_summary_ids = unpack(KEYS), unpack(ARGV)
@@ -561,8 +573,7 @@ class List(Object, Editable):
             raise error.ValueError('title_empty')
         if 'order' in attrs and attrs['order'] not in {None, 'title'}:
             raise error.ValueError(f"Unknown order {attrs['order']}")
-        features = {'check', 'assign', 'vote', 'value', 'time', 'location', 'play'}
-        if 'features' in attrs and not set(attrs['features']) <= features:
+        if 'features' in attrs and not _FEATURES.issuperset(attrs['features']):
             raise error.ValueError('feature_unknown')
         if 'mode' in attrs and attrs['mode'] not in {'collaborate', 'view'}:
             raise error.ValueError('Unknown mode')
@@ -732,22 +743,21 @@ class Item(Object, Editable, Trashable, WithContent):
     @property
     def list(self):
         # pylint: disable=missing-function-docstring; already documented
-        return self.app.lists[self._list_id]
+        # Skip the lists membership test, which scans the whole Redis list, as an item always
+        # belongs to an existing list
+        return self.app.r.oget(self._list_id, default=KeyError, expect=_EXPECT_LIST)
 
     def delete(self) -> None:
         f = script(self.app.r.r, """
-            local id = KEYS[1]
-            local item = cjson.decode(redis.call("GET", id))
+            local id, list_id = unpack(KEYS)
             redis.call("DEL", id, id .. ".assignees", id .. ".votes")
             redis.call("SREM", "items", id)
-            redis.call("LREM", item.list_id .. ".items", 1, id)
-            local lexical_key = item.list_id .. ".items.by_title.lexical"
-            redis.call(
-                "ZREM", item.list_id .. ".items.by_title", redis.call("HGET", lexical_key, id)
-            )
+            redis.call("LREM", list_id .. ".items", 1, id)
+            local lexical_key = list_id .. ".items.by_title.lexical"
+            redis.call("ZREM", list_id .. ".items.by_title", redis.call("HGET", lexical_key, id))
             redis.call("HDEL", lexical_key, id)
         """)
-        f([self.id])
+        f([self.id, self._list_id])
 
     def check(self):
         """See :http:post:`/api/items/(id)/check`."""
@@ -767,7 +777,8 @@ class Item(Object, Editable, Trashable, WithContent):
 
     async def edit(self, **attrs: object) -> None:
         await super().edit(**attrs)
-        self.list.update_value_summary()
+        if 'value' in attrs:
+            self.list.update_value_summary()
 
     async def do_edit(self, **attrs: Any) -> None:
         self._check_permission(self.app.user, 'item-modify')
@@ -779,15 +790,15 @@ class Item(Object, Editable, Trashable, WithContent):
         if 'title' in attrs:
             self.title = attrs['title']
             f = script(self.app.r.r, """
-                local id, id_by_title = unpack(KEYS), unpack(ARGV)
-                local object = cjson.decode(redis.call("GET", id))
-                local items_key = object.list_id .. ".items.by_title"
+                local id, list_id = unpack(KEYS)
+                local id_by_title = ARGV[1]
+                local items_key = list_id .. ".items.by_title"
                 local lexical_key = items_key .. ".lexical"
                 redis.call("ZREM", items_key, redis.call("HGET", lexical_key, id))
                 redis.call("ZADD", items_key, 0, id_by_title)
                 redis.call("HSET", lexical_key, id, id_by_title)
             """)
-            f([self.id], [lexical_value(self.id, self.title)])
+            f([self.id, self._list_id], [lexical_value(self.id, self.title)])
         if 'value' in attrs:
             self.value = attrs['value']
         if 'time' in attrs:
@@ -838,6 +849,9 @@ class Item(Object, Editable, Trashable, WithContent):
                 user in self.app.settings.staff)):
             raise error.PermissionError()
 
+_EXPECT_LIST = expect_type(List)
+_EXPECT_ITEM = expect_type(Item)
+
 class Items:
     """See :ref:`Items`."""
 
@@ -847,7 +861,7 @@ class Items:
     def __getitem__(self, key: str) -> Item:
         if not key.startswith('Item:'):
             raise KeyError(key)
-        return self.app.r.oget(key, default=KeyError, expect=expect_type(Item))
+        return self.app.r.oget(key, default=KeyError, expect=_EXPECT_ITEM)
 
 def _check_feature(user, feature, item):
     if feature not in item.list.features:
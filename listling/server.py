@@ -27,7 +27,6 @@ from urllib.parse import urlsplit
 from tornado.web import HTTPError, RequestHandler
 
 from micro import Location, error
-from micro.jsonredis import script
 from micro.ratelimit import RateLimit, RateLimitError
 import micro.server
 from micro.server import (
@@ -38,6 +37,10 @@ from micro.util import Expect, expect_type, parse_isotime, randstr
 from . import Listling
 from .list import Owners
 
+_SHORTS_GET_RATE_LIMIT = RateLimit('shorts.get', 100, timedelta(days=1))
+_OPT_STR = Expect.opt(Expect.str)
+_OPT_FLOAT = Expect.opt(Expect.float)
+
 def make_server(
         *, port: int = 8080, url: str = None, debug: bool = False, redis_url: str = '',
         smtp_url: str = '', files_path: str = 'data', video_service_keys: Dict[str, str] = {},
@@ -137,11 +140,11 @@ class _ListEndpoint(Endpoint):
             'item_template': (str, None, 'opt')
         })
         if 'order' in self.args:
-            args['order'] = self.get_arg('order', Expect.opt(Expect.str))
+            args['order'] = self.get_arg('order', _OPT_STR)
         if 'assign_by_default' in self.args:
             args['assign_by_default'] = self.get_arg('assign_by_default', expect_type(bool))
         if 'value_unit' in self.args:
-            args['value_unit'] = self.get_arg('value_unit', Expect.opt(Expect.str))
+            args['value_unit'] = self.get_arg('value_unit', _OPT_STR)
         await lst.edit(**args)
         self.write(lst.json(restricted=True, include=True))
 
@@ -193,8 +196,8 @@ class _ListItemsEndpoint(Endpoint):
         })
         if args.get('resource') is not None:
             args['resource'] = self.server.rewrite(args['resource'], reverse=True)
-        value = self.get_arg('value', Expect.opt(Expect.float), default=None)
-        time_arg = self.get_arg('time', Expect.opt(Expect.str), default=None)
+        value = self.get_arg('value', _OPT_FLOAT, default=None)
+        time_arg = self.get_arg('time', _OPT_STR, default=None)
         try:
             time = None if time_arg is None else parse_isotime(time_arg)
         except ValueError as e:
@@ -223,9 +226,9 @@ class _ItemEndpoint(Endpoint):
         if args.get('resource') is not None:
             args['resource'] = self.server.rewrite(args['resource'], reverse=True)
         if 'value' in self.args:
-            args['value'] = self.get_arg('value', Expect.opt(Expect.float))
+            args['value'] = self.get_arg('value', _OPT_FLOAT)
         if 'time' in self.args:
-            time_arg = self.get_arg('time', Expect.opt(Expect.str))
+            time_arg = self.get_arg('time', _OPT_STR)
             try:
                 args['time'] = None if time_arg is None else parse_isotime(time_arg)
             except ValueError as e:
@@ -307,12 +310,7 @@ class _Shorts(RequestHandler):
         # to find any short p = 1‰, the presumed number of active shorts s = 50 and the rate limit
         # r = 100
         short = randstr(5)
-        f = script(self.application.settings['server'].app.r, """
-            local key, url = KEYS[1], ARGV[1]
-            redis.call('SET', key, url)
-            redis.call('EXPIRE', key, 24 * 60 * 60)
-        """)
-        f([f'short:{short}'], [url])
+        self.application.settings['server'].app.r.set(f'short:{short}', url, ex=24 * 60 * 60)
         self.set_status(HTTPStatus.CREATED)
         self.set_header('Location', f'/s/{short}')
 
@@ -320,8 +318,7 @@ class _Short(RequestHandler):
     def get(self, short: str) -> None:
         app = self.application.settings['server'].app
         try:
-            app.rate_limiter.count(RateLimit('shorts.get', 100, timedelta(days=1)),
-                                   self.request.remote_ip)
+            app.rate_limiter.count(_SHORTS_GET_RATE_LIMIT, self.request.remote_ip)
         except RateLimitError as e:
             raise HTTPError(HTTPStatus.TOO_MANY_REQUESTS) from e
         url = app.r.get(f'short:{short}')
@@ -145,6 +145,16 @@ class ListTest(ListlingTestCase):
         lst = self.app.lists[self.list.id]
         self.assertEqual(lst.features, [])
 
+    @gen_test
+    async def test_edit_without_features(self) -> None:
+        self.app.r.caching = False
+        await self.list.edit(features=['assign', 'value'])
+        item = await self.list.items.create('Sleep', value=60)
+        item.assignees.assign(self.user)
+        await self.list.edit(description='What has to be done!')
+        lst = self.app.lists[self.list.id]
+        self.assertEqual(lst.value_summary, [('total', 60), (self.user, 60)])
+
     @gen_test
     async def test_edit_as_user(self) -> None:
         lst = self.app.lists.create()
@@ -203,6 +213,15 @@ class ListItemsTest(ListlingTestCase):
         await self.list.edit(assign_by_default=True)
         item = await self.list.items.create('Feast')
         self.assertEqual(item.assignees[:], [self.user])
+        self.assertEqual(self.list.value_summary, [('total', 0), (self.user, 0)])
+
+    @gen_test
+    async def test_create_for_assign_by_default_edited_elsewhere(self) -> None:
+        self.app.r.caching = False
+        await self.app.lists[self.list.id].edit(assign_by_default=True)
+        await self.list.items.create('Feast')
+        lst = self.app.lists[self.list.id]
+        self.assertEqual(lst.value_summary, [('total', 0), (self.user, 0)])
 
     @gen_test
     async def test_move(self) -> None:
@@ -241,6 +260,20 @@ class ItemTest(ListlingTestCase):
         await self.list.edit(order='title')
         self.assertEqual(self.list.items[:], [items[1], self.item, items[0]])
 
+    @gen_test
+    async def test_edit_without_value(self) -> None:
+        await self.item.edit(title='Hug', text='Meow!')
+        self.assertEqual(self.list.value_summary, [('total', 5)])
+
+    @gen_test
+    async def test_edit_title_twice(self) -> None:
+        items = self.list.items[:]
+        await self.item.edit(title='Hug')
+        await self.item.edit(title='Bite')
+        await self.list.edit(order='title')
+        self.assertEqual(self.list.items[:], [self.item, items[1], items[0]])
+        self.assertEqual(self.app.r.r.zcard(f'{self.list.id}.items.by_title'), 3)
+
     @gen_test
     async def test_delete(self) -> None:
         self.app.r.caching = False
@@ -257,6 +290,9 @@ class ItemTest(ListlingTestCase):
         self.assertEqual(self.list.items[:], items[:2])
         await self.list.edit(order='title')
         self.assertEqual(self.list.items[:], [items[1], items[0]])
+        self.assertEqual(self.app.r.r.zcard(f'{self.list.id}.items.by_title'), 2)
+        self.assertFalse(
+            self.app.r.r.hexists(f'{self.list.id}.items.by_title.lexical', self.item.id))
 
     def test_trash(self) -> None:
         self.item.trash()